@@ -1,13 +1,18 @@
+import io
 import os
+import time
 from datetime import date
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple, Union
 
+import numpy as np
 import pandas as pd
+import psycopg2
 import streamlit as st
 from dotenv import load_dotenv
-from sqlalchemy import create_engine, text
-from sqlalchemy.engine import Engine
+from sqlalchemy import MetaData, Table, create_engine, insert, text
+from sqlalchemy.engine import Connection, Engine
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.sql import Executable
 
 load_dotenv()
 
@@ -57,6 +62,65 @@ SUPPLIERS = [
     "MONREALE",
 ]
 
+AIRLINES_WITH_BLANK = [""] + AIRLINES
+
+OPTION_INDEX: Dict[str, Dict[str, int]] = {
+    "airline": {value: index for index, value in enumerate(AIRLINES_WITH_BLANK)},
+    "service_type": {value: index for index, value in enumerate(SERVICE_TYPES)},
+    "status": {value: index for index, value in enumerate(STATUSES)},
+    "cost_center": {value: index for index, value in enumerate(COST_CENTERS)},
+    "supplier": {value: index for index, value in enumerate(SUPPLIERS)},
+}
+
+INSERT_BATCH_SIZE = 1000
+FETCH_BATCH_SIZE = 5000
+CACHE_TTL_SECONDS = 60
+
+CATEGORY_COLUMNS = ["service_type", "airline", "cost_center", "status", "supplier"]
+DATE_COLUMNS = ["issue_date", "departure_date", "nf_issue_date"]
+INSERT_COLUMNS = [
+    "service_type",
+    "control",
+    "issue_date",
+    "issuer",
+    "airline",
+    "departure_date",
+    "month_number",
+    "origin",
+    "destination",
+    "user_name",
+    "reason",
+    "cost_center",
+    "service_cost",
+    "fee",
+    "status",
+    "supplier",
+    "nf_issue_date",
+    "nf_number",
+]
+LIST_COLUMNS = [
+    "id",
+    "service_type",
+    "control",
+    "issue_date",
+    "issuer",
+    "airline",
+    "departure_date",
+    "month_number",
+    "origin",
+    "destination",
+    "user_name",
+    "cost_center",
+    "service_cost",
+    "fee",
+    "total_cost",
+    "status",
+    "supplier",
+    "nf_issue_date",
+    "nf_number",
+]
+REQUIRED_IMPORT_COLUMNS = ["service_type", "control", "issue_date", "issuer", "month_number"]
+
 MONTH_CHOICES: List[Tuple[int, str]] = [
     (1, "01 - Janeiro"),
     (2, "02 - Fevereiro"),
@@ -72,18 +136,13 @@ MONTH_CHOICES: List[Tuple[int, str]] = [
     (12, "12 - Dezembro"),
 ]
 
+MONTH_LABEL_BY_NUMBER: Dict[int, str] = dict(MONTH_CHOICES)
+MONTH_NUMBERS = [choice[0] for choice in MONTH_CHOICES]
+MONTH_LABELS = [choice[1] for choice in MONTH_CHOICES]
+MONTH_NUMBER_TO_INDEX = {number: index for index, number in enumerate(MONTH_NUMBERS)}
 
-@st.cache_resource(show_spinner=False)
-def get_engine() -> Engine:
-    database_url = os.getenv("DATABASE_URL")
-    if not database_url:
-        st.error("Variável de ambiente DATABASE_URL não configurada.")
-        st.stop()
-    return create_engine(database_url, pool_pre_ping=True)
-
-
-def ensure_table(engine: Engine) -> None:
-    ddl = """
+_CREATE_TABLE_STMT = text(
+    """
     CREATE TABLE IF NOT EXISTS travel_services (
         id SERIAL PRIMARY KEY,
         service_type VARCHAR(32) NOT NULL,
@@ -108,92 +167,261 @@ def ensure_table(engine: Engine) -> None:
         created_at TIMESTAMPTZ DEFAULT NOW()
     );
     """
-    with engine.begin() as conn:
-        conn.execute(text(ddl))
+)
+
+_UPDATE_STMT = text(
+    f"""
+    UPDATE travel_services SET
+        service_type=:service_type,
+        control=:control,
+        issue_date=:issue_date,
+        issuer=:issuer,
+        airline=:airline,
+        departure_date=:departure_date,
+        month_number=:month_number,
+        origin=:origin,
+        destination=:destination,
+        user_name=:user_name,
+        reason=:reason,
+        cost_center=:cost_center,
+        service_cost=:service_cost,
+        fee=:fee,
+        status=:status,
+        supplier=:supplier,
+        nf_issue_date=:nf_issue_date,
+        nf_number=:nf_number
+    WHERE id=:id
+    RETURNING {', '.join(LIST_COLUMNS)};
+    """
+)
+
+_SELECT_ROW_STMT = text("SELECT * FROM travel_services WHERE id = :id;")
+
+_DELETE_STMT = text("DELETE FROM travel_services WHERE id = ANY(:ids);")
 
+_COPY_SQL = f"COPY travel_services ({', '.join(INSERT_COLUMNS)}) FROM STDIN WITH CSV"
 
-def fetch_dataframe(engine: Engine) -> pd.DataFrame:
-    query = """
-    SELECT
-        id, service_type, control, issue_date, issuer, airline,
-        departure_date, month_number, origin, destination,
-        user_name, reason, cost_center, service_cost, fee,
-        total_cost, status, supplier, nf_issue_date, nf_number,
-        created_at
+_SELECT_LIST_STMT = text(
+    f"""
+    SELECT {', '.join(LIST_COLUMNS)}
     FROM travel_services
     ORDER BY issue_date DESC, id DESC;
     """
+)
+
+
+@st.cache_resource(show_spinner=False)
+def get_engine() -> Engine:
+    database_url = os.getenv("DATABASE_URL")
+    if not database_url:
+        st.error("Variável de ambiente DATABASE_URL não configurada.")
+        st.stop()
+    return create_engine(
+        database_url,
+        pool_size=10,
+        max_overflow=20,
+        pool_recycle=1800,
+        pool_pre_ping=False,
+        executemany_mode="values_plus_batch",
+        insertmanyvalues_page_size=INSERT_BATCH_SIZE,
+        executemany_batch_page_size=500,
+    )
+
+
+def ensure_table(engine: Engine) -> None:
     with engine.begin() as conn:
-        return pd.read_sql(text(query), conn)
-
-
-def insert_record(engine: Engine, payload: Dict) -> None:
-    stmt = text(
-        """
-        INSERT INTO travel_services (
-            service_type, control, issue_date, issuer, airline,
-            departure_date, month_number, origin, destination,
-            user_name, reason, cost_center, service_cost, fee,
-            status, supplier, nf_issue_date, nf_number
-        ) VALUES (
-            :service_type, :control, :issue_date, :issuer, :airline,
-            :departure_date, :month_number, :origin, :destination,
-            :user_name, :reason, :cost_center, :service_cost, :fee,
-            :status, :supplier, :nf_issue_date, :nf_number
-        );
-        """
+        conn.execute(_CREATE_TABLE_STMT)
+
+
+@st.cache_resource(show_spinner=False)
+def get_engine_and_bootstrap() -> Engine:
+    engine = get_engine()
+    ensure_table(engine)
+    return engine
+
+
+def _uncached_fetch(engine: Engine) -> pd.DataFrame:
+    with engine.connect().execution_options(
+        stream_results=True, yield_per=FETCH_BATCH_SIZE
+    ) as conn:
+        return read_frame(conn, _SELECT_LIST_STMT, {})
+
+
+def _read_raw_frame(
+    conn: Connection, stmt: Executable, params: Union[Dict, List[Dict]]
+) -> pd.DataFrame:
+    return pd.read_sql_query(
+        stmt,
+        conn,
+        params=params,
+        parse_dates=DATE_COLUMNS,
+        dtype_backend="pyarrow",
     )
+
+
+def read_frame(conn: Connection, stmt: Executable, params: Dict) -> pd.DataFrame:
+    return shrink_dataframe(_read_raw_frame(conn, stmt, params))
+
+
+def shrink_dataframe(df: pd.DataFrame) -> pd.DataFrame:
+    for column in CATEGORY_COLUMNS:
+        df[column] = df[column].astype("category")
+    df["month_number"] = df["month_number"].astype("int8")
+    df["id"] = df["id"].astype("int32")
+    return df
+
+
+@st.cache_data(show_spinner=False, ttl=CACHE_TTL_SECONDS)
+def _cached_fetch(version: int) -> pd.DataFrame:
+    return _uncached_fetch(get_engine())
+
+
+def fetch_list_view(
+    statuses: Optional[List[str]] = None,
+    months: Optional[List[int]] = None,
+    issue_range: Optional[Tuple[date, date]] = None,
+) -> pd.DataFrame:
+    loaded_at = st.session_state.get("cached_df_loaded_at", 0.0)
+    if (
+        "cached_df" not in st.session_state
+        or time.monotonic() - loaded_at > CACHE_TTL_SECONDS
+    ):
+        st.session_state["cached_df"] = _cached_fetch(
+            st.session_state.get("data_version", 0)
+        )
+        st.session_state["cached_df_loaded_at"] = time.monotonic()
+    return filter_frame(st.session_state["cached_df"], statuses, months, issue_range)
+
+
+def filter_frame(
+    data: pd.DataFrame,
+    statuses: Optional[List[str]] = None,
+    months: Optional[List[int]] = None,
+    issue_range: Optional[Tuple[date, date]] = None,
+) -> pd.DataFrame:
+    if not (statuses or months or issue_range):
+        return data
+    mask = np.ones(len(data), dtype=bool)
+    if statuses:
+        mask &= data["status"].isin(statuses).to_numpy()
+    if months:
+        mask &= data["month_number"].isin(months).to_numpy()
+    if issue_range:
+        start, end = issue_range
+        issue = data["issue_date"].to_numpy()
+        mask &= (issue >= np.datetime64(start)) & (issue <= np.datetime64(end))
+    return data.loc[mask]
+
+
+def mark_data_changed(
+    returned: Optional[pd.DataFrame] = None,
+    deleted_ids: Optional[List[int]] = None,
+) -> None:
+    st.session_state["data_version"] = st.session_state.get("data_version", 0) + 1
+    _cached_fetch.clear()
+    _cached_full_row.clear()
+    if returned is None and not deleted_ids:
+        st.session_state.pop("cached_df", None)
+        return
+    if "cached_df" not in st.session_state:
+        return
+    cached = st.session_state["cached_df"]
+    if returned is not None:
+        cached = merge_rows(cached, returned)
+    if deleted_ids:
+        cached = cached[~cached["id"].isin(deleted_ids)].reset_index(drop=True)
+    st.session_state["cached_df"] = cached
+
+
+def merge_rows(cached: pd.DataFrame, returned: pd.DataFrame) -> pd.DataFrame:
+    if cached.empty:
+        return returned
+    remaining = cached[~cached["id"].isin(returned["id"])]
+    dtypes = cached.dtypes.to_dict()
+    for column in CATEGORY_COLUMNS:
+        dtypes[column] = pd.CategoricalDtype(
+            cached[column].cat.categories.union(returned[column].cat.categories)
+        )
+    merged = pd.concat(
+        [returned.astype(dtypes), remaining.astype(dtypes)], ignore_index=True
+    )
+    return merged.sort_values(["issue_date", "id"], ascending=False, ignore_index=True)
+
+
+@st.cache_resource(show_spinner=False)
+def get_services_table() -> Table:
+    return Table("travel_services", MetaData(), autoload_with=get_engine())
+
+
+def insert_records_bulk(engine: Engine, payloads: List[Dict]) -> Optional[pd.DataFrame]:
+    if not payloads:
+        return None
+    table = get_services_table()
+    stmt = insert(table).returning(*(table.c[column] for column in LIST_COLUMNS))
     with engine.begin() as conn:
-        conn.execute(stmt, payload)
+        frames = [
+            _read_raw_frame(conn, stmt, payloads[offset : offset + INSERT_BATCH_SIZE])
+            for offset in range(0, len(payloads), INSERT_BATCH_SIZE)
+        ]
+    return shrink_dataframe(pd.concat(frames, ignore_index=True))
 
 
-def update_record(engine: Engine, record_id: int, payload: Dict) -> None:
-    payload["id"] = record_id
-    stmt = text(
-        """
-        UPDATE travel_services SET
-            service_type=:service_type,
-            control=:control,
-            issue_date=:issue_date,
-            issuer=:issuer,
-            airline=:airline,
-            departure_date=:departure_date,
-            month_number=:month_number,
-            origin=:origin,
-            destination=:destination,
-            user_name=:user_name,
-            reason=:reason,
-            cost_center=:cost_center,
-            service_cost=:service_cost,
-            fee=:fee,
-            status=:status,
-            supplier=:supplier,
-            nf_issue_date=:nf_issue_date,
-            nf_number=:nf_number
-        WHERE id=:id;
-        """
+def insert_record(engine: Engine, payload: Dict) -> Optional[pd.DataFrame]:
+    return insert_records_bulk(engine, [payload])
+
+
+def bulk_copy(engine: Engine, df: pd.DataFrame) -> None:
+    buffer = io.StringIO()
+    df[INSERT_COLUMNS].fillna({"service_cost": "0", "fee": "0"}).to_csv(
+        buffer, index=False, header=False, date_format="%Y-%m-%d"
     )
+    buffer.seek(0)
+    raw = engine.raw_connection()
+    try:
+        with raw.cursor() as cursor:
+            cursor.copy_expert(_COPY_SQL, buffer)
+        raw.commit()
+    finally:
+        raw.close()
+
+
+def update_record(engine: Engine, record_id: int, payload: Dict) -> pd.DataFrame:
+    payload["id"] = record_id
     with engine.begin() as conn:
-        conn.execute(stmt, payload)
+        return read_frame(conn, _UPDATE_STMT, payload)
+
+
+def _uncached_full_row(engine: Engine, record_id: int) -> Optional[Dict]:
+    with engine.connect() as conn:
+        row = conn.execute(_SELECT_ROW_STMT, {"id": record_id}).mappings().one_or_none()
+    return dict(row) if row is not None else None
+
+
+@st.cache_data(show_spinner=False, ttl=CACHE_TTL_SECONDS)
+def _cached_full_row(record_id: int, version: int) -> Optional[Dict]:
+    return _uncached_full_row(get_engine(), record_id)
+
+
+def fetch_full_row(record_id: int) -> Optional[Dict]:
+    return _cached_full_row(record_id, st.session_state.get("data_version", 0))
 
 
 def delete_records(engine: Engine, ids: List[int]) -> None:
-    stmt = text("DELETE FROM travel_services WHERE id = ANY(:ids);")
     with engine.begin() as conn:
-        conn.execute(stmt, {"ids": ids})
+        conn.execute(_DELETE_STMT, {"ids": ids})
 
 
 def pt_month_label(month_number: int) -> str:
-    mapping = dict(MONTH_CHOICES)
-    return mapping.get(month_number, "")
+    return MONTH_LABEL_BY_NUMBER.get(month_number, "")
 
 
 def month_selectbox(label: str, default_value: int) -> int:
-    labels = [choice[1] for choice in MONTH_CHOICES]
-    numbers = [choice[0] for choice in MONTH_CHOICES]
-    default_index = numbers.index(default_value) if default_value in numbers else 0
-    selection = st.selectbox(label, labels, index=default_index)
-    return numbers[labels.index(selection)]
+    return st.selectbox(
+        label,
+        MONTH_NUMBERS,
+        index=MONTH_NUMBER_TO_INDEX.get(default_value, 0),
+        format_func=pt_month_label,
+    )
 
 
 def optional_date_input(label: str, value: Optional[date]) -> Optional[date]:
@@ -254,7 +482,7 @@ def show_create_tab(engine: Engine) -> None:
                 "Emissão", value=date.today(), format="DD/MM/YYYY"
             )
             issuer = st.text_input("Emissor")
-            airline = st.selectbox("Companhia aérea", [""] + AIRLINES)
+            airline = st.selectbox("Companhia aérea", AIRLINES_WITH_BLANK)
             month_number = month_selectbox("Mês (número ↔ nome)", issue_date.month)
             status = st.selectbox("Status", STATUSES)
         with col2:
@@ -303,7 +531,8 @@ def show_create_tab(engine: Engine) -> None:
                 nf_number,
             )
             try:
-                insert_record(engine, payload)
+                returned = insert_record(engine, payload)
+                mark_data_changed(returned)
                 st.success("Registro salvo com sucesso.")
                 st.info(
                     f"Custo total calculado: R$ {payload['service_cost'] + payload['fee']:.2f}"
@@ -315,16 +544,10 @@ def show_create_tab(engine: Engine) -> None:
 
 def show_table_tab(engine: Engine) -> None:
     st.subheader("Consultar serviços")
-    data = fetch_dataframe(engine)
-    if data.empty:
-        st.info("Nenhum registro cadastrado.")
-        return
 
     with st.expander("Filtros opcionais"):
         selected_status = st.multiselect("Status", STATUSES)
-        selected_months = st.multiselect(
-            "Mês", [choice[1] for choice in MONTH_CHOICES]
-        )
+        selected_months = st.multiselect("Mês", MONTH_NUMBERS, format_func=pt_month_label)
         use_issue_filter = st.checkbox("Filtrar por intervalo de emissão", value=False)
         issue_range: Optional[Tuple[date, date]] = None
         if use_issue_filter:
@@ -334,85 +557,86 @@ def show_table_tab(engine: Engine) -> None:
                 format="DD/MM/YYYY",
                 key="filter_issue_range",
             )
+            if len(issue_range) != 2:
+                issue_range = None
 
-    filtered = data.copy()
-    if selected_status:
-        filtered = filtered[filtered["status"].isin(selected_status)]
-    if selected_months:
-        month_numbers = [
-            choice[0] for choice in MONTH_CHOICES if choice[1] in selected_months
-        ]
-        filtered = filtered[filtered["month_number"].isin(month_numbers)]
-    if issue_range:
-        start, end = issue_range
-        filtered = filtered[
-            (filtered["issue_date"] >= pd.to_datetime(start))
-            & (filtered["issue_date"] <= pd.to_datetime(end))
-        ]
+    filtered = fetch_list_view(
+        statuses=selected_status,
+        months=selected_months,
+        issue_range=issue_range,
+    )
 
     if filtered.empty:
-        st.warning("Nenhum registro encontrado com os filtros informados.")
+        if selected_status or selected_months or issue_range:
+            st.warning("Nenhum registro encontrado com os filtros informados.")
+        else:
+            st.info("Nenhum registro cadastrado.")
         return
 
     display_df = filtered.copy()
-    display_df["issue_date"] = display_df["issue_date"].dt.strftime("%d/%m/%Y")
-    display_df["departure_date"] = display_df["departure_date"].dt.strftime(
-        "%d/%m/%Y"
+    for column in DATE_COLUMNS:
+        display_df[column] = display_df[column].dt.strftime("%d/%m/%Y").fillna("")
+    month_codes = display_df["month_number"].astype("int16") - 1
+    display_df["month"] = pd.Categorical.from_codes(
+        month_codes.where(month_codes.between(0, len(MONTH_LABELS) - 1), -1),
+        categories=MONTH_LABELS,
     )
-    display_df["nf_issue_date"] = display_df["nf_issue_date"].dt.strftime("%d/%m/%Y")
-    display_df["month"] = display_df["month_number"].apply(pt_month_label)
     display_df = display_df.drop(columns=["month_number"])
     st.dataframe(display_df, use_container_width=True, hide_index=True)
 
 
 def show_update_tab(engine: Engine) -> None:
     st.subheader("Atualizar registro")
-    data = fetch_dataframe(engine)
+    data = fetch_list_view()
     if data.empty:
         st.info("Nenhum registro disponível para edição.")
         return
 
-    record_options = data.apply(
-        lambda row: (int(row["id"]), f"{int(row['id'])} · {row['control']}"), axis=1
-    ).tolist()
-    option_labels = {item[0]: item[1] for item in record_options}
+    option_labels = dict(
+        zip(
+            data["id"].tolist(),
+            (data["id"].astype(str) + " · " + data["control"].astype(str)).tolist(),
+        )
+    )
 
     selected_id = st.selectbox(
         "Selecione o registro",
-        options=list(option_labels.keys()),
-        format_func=lambda value: option_labels[value],
+        options=list(option_labels),
+        format_func=option_labels.__getitem__,
     )
-    row = data[data["id"] == selected_id].iloc[0]
+    row = fetch_full_row(selected_id)
+    if row is None:
+        st.warning("Registro não encontrado; ele pode ter sido excluído.")
+        return
 
     with st.form("update_form"):
         col1, col2 = st.columns(2)
         with col1:
             service_type = st.selectbox(
-                "Tipo de serviço", SERVICE_TYPES, index=SERVICE_TYPES.index(row["service_type"])
+                "Tipo de serviço",
+                SERVICE_TYPES,
+                index=OPTION_INDEX["service_type"].get(row["service_type"], 0),
             )
             control = st.text_input("Controle", value=row["control"])
             issue_date = st.date_input(
                 "Emissão",
-                value=row["issue_date"].date(),
+                value=row["issue_date"],
                 format="DD/MM/YYYY",
             )
             issuer = st.text_input("Emissor", value=row["issuer"])
             airline = st.selectbox(
                 "Companhia aérea",
-                [""] + AIRLINES,
-                index=([""] + AIRLINES).index(row["airline"] or ""),
+                AIRLINES_WITH_BLANK,
+                index=OPTION_INDEX["airline"].get(row["airline"], 0),
             )
             month_number = month_selectbox("Mês (número ↔ nome)", int(row["month_number"]))
             status = st.selectbox(
                 "Status",
                 STATUSES,
-                index=STATUSES.index(row["status"]) if row["status"] else 0,
+                index=OPTION_INDEX["status"].get(row["status"], 0),
             )
         with col2:
-            departure_date = optional_date_input(
-                "Partida / Check-in",
-                row["departure_date"].date() if pd.notna(row["departure_date"]) else None,
-            )
+            departure_date = optional_date_input("Partida / Check-in", row["departure_date"])
             origin = st.text_input("Origem", value=row["origin"] or "")
             destination = st.text_input("Destino", value=row["destination"] or "")
             user_name = st.text_input("Usuário", value=row["user_name"] or "")
@@ -420,12 +644,12 @@ def show_update_tab(engine: Engine) -> None:
             cost_center = st.selectbox(
                 "Centro de custo",
                 COST_CENTERS,
-                index=COST_CENTERS.index(row["cost_center"]) if row["cost_center"] in COST_CENTERS else 0,
+                index=OPTION_INDEX["cost_center"].get(row["cost_center"], 0),
             )
             supplier = st.selectbox(
                 "Fornecedor",
                 SUPPLIERS,
-                index=SUPPLIERS.index(row["supplier"]) if row["supplier"] in SUPPLIERS else 0,
+                index=OPTION_INDEX["supplier"].get(row["supplier"], 0),
             )
 
         service_cost = st.number_input(
@@ -443,10 +667,7 @@ def show_update_tab(engine: Engine) -> None:
 
         col_nf1, col_nf2 = st.columns(2)
         with col_nf1:
-            nf_issue_date = optional_date_input(
-                "Emissão NF",
-                row["nf_issue_date"].date() if pd.notna(row["nf_issue_date"]) else None,
-            )
+            nf_issue_date = optional_date_input("Emissão NF", row["nf_issue_date"])
         with col_nf2:
             nf_number = st.text_input("Nº NF", value=row["nf_number"] or "")
 
@@ -473,7 +694,8 @@ def show_update_tab(engine: Engine) -> None:
                 nf_number,
             )
             try:
-                update_record(engine, selected_id, payload)
+                returned = update_record(engine, selected_id, payload)
+                mark_data_changed(returned)
                 st.success("Registro atualizado.")
                 st.info(
                     f"Novo custo total: R$ {payload['service_cost'] + payload['fee']:.2f}"
@@ -485,31 +707,84 @@ def show_update_tab(engine: Engine) -> None:
 
 def show_delete_tab(engine: Engine) -> None:
     st.subheader("Excluir registros")
-    data = fetch_dataframe(engine)
+    data = fetch_list_view()
     if data.empty:
         st.info("Nenhum registro disponível para exclusão.")
         return
 
-    ids = data["id"].tolist()
-    labels = data.apply(
-        lambda row: f"{int(row['id'])} · {row['control']} · {row['service_type']}",
-        axis=1,
-    ).tolist()
+    labels = (
+        data["id"].astype(str)
+        + " · "
+        + data["control"].astype(str)
+        + " · "
+        + data["service_type"].astype(str)
+    )
+    label_map = dict(zip(data["id"].tolist(), labels.tolist()))
     selection = st.multiselect(
         "Selecione os registros para excluir",
-        options=ids,
-        format_func=lambda value: labels[ids.index(value)],
+        options=list(label_map),
+        format_func=label_map.__getitem__,
     )
 
     if selection and st.button("Excluir registros selecionados", type="primary"):
         try:
             delete_records(engine, selection)
+            mark_data_changed(deleted_ids=selection)
             st.success(f"{len(selection)} registro(s) excluído(s).")
             st.rerun()
         except SQLAlchemyError as exc:
             st.error(f"Erro ao excluir: {exc.orig if hasattr(exc, 'orig') else exc}")
 
 
+def show_import_tab(engine: Engine) -> None:
+    st.subheader("Importar CSV")
+    st.caption(
+        "O arquivo deve ter cabeçalho com os nomes das colunas da tabela; "
+        f"obrigatórias: {', '.join(REQUIRED_IMPORT_COLUMNS)}."
+    )
+    uploader_key = f"import_csv_{st.session_state.get('import_uploads', 0)}"
+    uploaded = st.file_uploader("Arquivo CSV", type="csv", key=uploader_key)
+    if uploaded is None:
+        return
+
+    try:
+        data = pd.read_csv(uploaded, dtype=str, keep_default_na=False)
+    except (ValueError, pd.errors.ParserError) as exc:
+        st.error(f"Erro ao ler o arquivo: {exc}")
+        return
+
+    data.columns = data.columns.str.strip()
+    missing = [column for column in REQUIRED_IMPORT_COLUMNS if column not in data.columns]
+    if missing:
+        st.error(f"Colunas obrigatórias ausentes: {', '.join(missing)}")
+        return
+
+    data = data.apply(lambda column: column.str.strip())
+    data = data.reindex(columns=INSERT_COLUMNS).replace("", None)
+
+    invalid = []
+    for column, allowed in OPTION_INDEX.items():
+        values = data[column].dropna()
+        unknown = sorted(set(values[~values.isin(allowed)]))
+        if unknown:
+            invalid.append(f"{column}: {', '.join(unknown)}")
+    if invalid:
+        st.error("Valores não reconhecidos — " + "; ".join(invalid))
+        return
+
+    st.dataframe(data.head(20), use_container_width=True, hide_index=True)
+
+    if st.button(f"Importar {len(data)} registro(s)", type="primary"):
+        try:
+            bulk_copy(engine, data)
+            mark_data_changed()
+            st.session_state["import_uploads"] = st.session_state.get("import_uploads", 0) + 1
+            st.success(f"{len(data)} registro(s) importado(s).")
+            st.rerun()
+        except (psycopg2.Error, SQLAlchemyError) as exc:
+            st.error(f"Erro ao importar: {exc.orig if hasattr(exc, 'orig') else exc}")
+
+
 def main() -> None:
     st.set_page_config(page_title="CRUD Serviços de Viagem", layout="wide")
     st.title("CRUD de Serviços de Viagem")
@@ -517,10 +792,9 @@ def main() -> None:
         "Gerencie serviços (transporte, hospedagem, passagens e seguros) com integração PostgreSQL."
     )
 
-    engine = get_engine()
-    ensure_table(engine)
+    engine = get_engine_and_bootstrap()
 
-    tabs = st.tabs(["Cadastrar", "Consultar", "Atualizar", "Excluir"])
+    tabs = st.tabs(["Cadastrar", "Consultar", "Atualizar", "Excluir", "Importar CSV"])
     with tabs[0]:
         show_create_tab(engine)
     with tabs[1]:
@@ -529,6 +803,8 @@ def main() -> None:
         show_update_tab(engine)
     with tabs[3]:
         show_delete_tab(engine)
+    with tabs[4]:
+        show_import_tab(engine)
 
 
 if __name__ == "__main__":